@@ -30,6 +30,9 @@ import time
 # Map from device_id -> (process, logcat_num)
 devices = {}
 
+_ADB_DEVICES_RE = re.compile(r'^(\S+)\tdevice$', re.MULTILINE)
+_WAITING_FOR_DEVICE_RE = re.compile('- waiting for device -')
+
 
 class TimeoutException(Exception):
   """Exception used to signal a timeout."""
@@ -50,9 +53,8 @@ def StartLogcatIfNecessary(device_id, adb_cmd, base_dir):
       return
     else:
       logging.info('Logcat for device %s has died', device_id)
-      error_filter = re.compile('- waiting for device -')
       for line in process.stderr:
-        if not error_filter.match(line):
+        if not _WAITING_FOR_DEVICE_RE.match(line):
           logging.error(device_id + ':   ' + line)
 
   logging.info('Starting logcat %d for device %s', logcat_num,
@@ -85,7 +87,7 @@ def GetAttachedDevices(adb_cmd):
                                 stderr=subprocess.PIPE).communicate()
     if err:
       logging.warning('adb device error %s', err.strip())
-    return re.findall('^(\\S+)\tdevice$', out, re.MULTILINE)
+    return _ADB_DEVICES_RE.findall(out)
   except TimeoutException:
     logging.warning('"adb devices" command timed out')
     return []
@@ -32,6 +32,9 @@ import time
 # Set this to debug for more verbose output
 LOG_LEVEL = logging.INFO
 
+_LOGCAT_FILE_RE = re.compile(r'^logcat_(\S+)_(\d+)$')
+_TIMESTAMPED_LINE_RE = re.compile(r'^\d{2}-\d{2} \d{2}:\d{2}:\d{2}.\d{3} ')
+
 
 def CombineLogFiles(list_of_lists, logger):
   """Splices together multiple logcats from the same device.
@@ -54,7 +57,7 @@ def CombineLogFiles(list_of_lists, logger):
       try:
         line = cur_device_log[-1]
         # Used to make sure we only splice on a timestamped line
-        if re.match(r'^\d{2}-\d{2} \d{2}:\d{2}:\d{2}.\d{3} ', line):
+        if _TIMESTAMPED_LINE_RE.match(line):
           common_index = cur_file_lines.index(line)
         else:
           logger.warning('splice error - no timestamp in "%s"?', line.strip())
@@ -78,11 +81,10 @@ def FindLogFiles(base_dir):
   Returns:
     Mapping of device_id to a sorted list of file paths for a given device
   """
-  logcat_filter = re.compile(r'^logcat_(\S+)_(\d+)$')
   # list of tuples (<device_id>, <seq num>, <full file path>)
   filtered_list = []
   for cur_file in os.listdir(base_dir):
-    matcher = logcat_filter.match(cur_file)
+    matcher = _LOGCAT_FILE_RE.match(cur_file)
     if matcher:
       filtered_list += [(matcher.group(1), int(matcher.group(2)),
                          os.path.join(base_dir, cur_file))]
@@ -8,23 +8,74 @@
 
 Allows an Android device to connect to services running on the host machine,
 i.e., "adb forward" in reverse. Requires |host_forwarder| and |device_forwarder|
-to be built.
+to be built, unless --use-adb-reverse is passed.
 """
 
 import argparse
+import logging
 import sys
 import time
 
 import devil_chromium
 
 from devil.android import device_blacklist
+from devil.android import device_errors
 from devil.android import device_utils
 from devil.android import forwarder
+from devil.android.sdk import adb_wrapper
+from devil.android.sdk import version_codes
+from devil.utils import cmd_helper
 from devil.utils import run_tests_helper
 
 from pylib import constants
 
 
+_ADB_REVERSE_TIMEOUT_SECS = 30
+
+
+def _RunAdbReverse(device, reverse_args):
+  cmd = [adb_wrapper.AdbWrapper.GetAdbPath(), '-s', str(device),
+         'reverse'] + reverse_args
+  try:
+    status, output = cmd_helper.GetCmdStatusAndOutputWithTimeout(
+        cmd, _ADB_REVERSE_TIMEOUT_SECS)
+  except cmd_helper.TimeoutError:
+    raise device_errors.CommandTimeoutError(
+        'Timed out after %ds running: %s' % (
+            _ADB_REVERSE_TIMEOUT_SECS, ' '.join(cmd)))
+  if status != 0:
+    raise device_errors.AdbCommandFailedError(
+        cmd, output, status, str(device))
+
+
+def _MapWithAdbReverse(device, port_pairs, mapped_device_ports):
+  """Forwards |port_pairs| with adb's built-in reverse forwarding.
+
+  This needs no forwarder binaries and no host or device processes of our own,
+  just one adb command per port pair. Each device port is appended to
+  |mapped_device_ports| once it is mapped, so a partial failure can still be
+  cleaned up.
+  """
+  for device_port, host_port in port_pairs:
+    _RunAdbReverse(device, ['tcp:%d' % device_port, 'tcp:%d' % host_port])
+    mapped_device_ports.append(device_port)
+
+
+def _UnmapWithAdbReverse(device, device_ports):
+  """Removes the reverse mappings for |device_ports|.
+
+  Mappings made by other tools or sessions are left alone, and failures are
+  logged rather than raised so they cannot hide an earlier error.
+  """
+  for device_port in device_ports:
+    try:
+      _RunAdbReverse(device, ['--remove', 'tcp:%d' % device_port])
+    except (device_errors.AdbCommandFailedError,
+            device_errors.CommandTimeoutError) as e:
+      logging.warning('Failed to remove reverse mapping for device port %d: '
+                      '%s', device_port, e)
+
+
 def main(argv):
   parser = argparse.ArgumentParser(
       usage='Usage: %(prog)s [options] device_port '
@@ -52,6 +103,11 @@ def main(argv):
   parser.add_argument(
       '--output-directory',
       help='Path to the root build directory.')
+  parser.add_argument(
+      '--use-adb-reverse',
+      action='store_true',
+      help='Use "adb reverse" instead of the forwarder binaries. Only '
+           'supported on devices running L or later.')
   parser.add_argument(
       'ports',
       nargs='+',
@@ -65,6 +121,8 @@ def main(argv):
     parser.error('Need even number of port pairs')
 
   port_pairs = zip(args.ports[::2], args.ports[1::2])
+  if args.use_adb_reverse and any(p == 0 for p, _ in port_pairs):
+    parser.error('--use-adb-reverse requires explicit device ports')
 
   if args.build_type:
     constants.SetBuildType(args.build_type)
@@ -77,14 +135,28 @@ def main(argv):
                else None)
   device = device_utils.DeviceUtils.HealthyDevices(
       blacklist=blacklist, device_arg=args.device)[0]
+
+  use_adb_reverse = args.use_adb_reverse
+  if use_adb_reverse and device.build_version_sdk < version_codes.LOLLIPOP:
+    logging.warning('adb reverse is not supported on %s. Falling back to the '
+                    'forwarder binaries.', str(device))
+    use_adb_reverse = False
+
+  mapped_device_ports = []
   try:
-    forwarder.Forwarder.Map(port_pairs, device)
+    if use_adb_reverse:
+      _MapWithAdbReverse(device, port_pairs, mapped_device_ports)
+    else:
+      forwarder.Forwarder.Map(port_pairs, device)
     while True:
       time.sleep(60)
   except KeyboardInterrupt:
     sys.exit(0)
   finally:
-    forwarder.Forwarder.UnmapAllDevicePorts(device)
+    if use_adb_reverse:
+      _UnmapWithAdbReverse(device, mapped_device_ports)
+    else:
+      forwarder.Forwarder.UnmapAllDevicePorts(device)
 
 if __name__ == '__main__':
   sys.exit(main(sys.argv[1:]))
@@ -35,15 +35,20 @@ def main():
   if not all_devices:
     raise RuntimeError('No healthy devices attached')
 
+  all_settings = []
   for filepath in args.filepaths:
-    all_settings = shared_preference_utils.ExtractSettingsFromJson(filepath)
+    all_settings.extend(
+        shared_preference_utils.ExtractSettingsFromJson(filepath))
+
+  def apply_settings(device):
     for setting in all_settings:
-      for device in all_devices:
-        shared_pref = shared_prefs.SharedPrefs(
-            device, setting['package'], setting['filename'],
-            use_encrypted_path=setting.get('supports_encrypted_path', False))
-        shared_preference_utils.ApplySharedPreferenceSetting(
-            shared_pref, setting)
+      shared_pref = shared_prefs.SharedPrefs(
+          device, setting['package'], setting['filename'],
+          use_encrypted_path=setting.get('supports_encrypted_path', False))
+      shared_preference_utils.ApplySharedPreferenceSetting(
+          shared_pref, setting)
+
+  device_utils.DeviceUtils.parallel(all_devices).pMap(apply_settings)
 
 
 if __name__ == '__main__':
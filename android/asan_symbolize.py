@@ -35,7 +35,7 @@ AsanLogLine = collections.namedtuple('AsanLogLine', 'raw,parsed')
 
 def _ParseAsanLogLine(line):
   """Parse line into corresponding AsanParsedLine value, if any, or None."""
-  m = re.match(_RE_ASAN, line)
+  m = _RE_ASAN.match(line)
   if not m:
     return None
   return AsanParsedLine(prefix=m.group(1),
@@ -183,7 +183,7 @@ class ProguardMapping(object):
     # {Method: set(Method)}
     self._method_mapping = collections.defaultdict(set)
     # {String: String} String is class name in type descriptor format
-    self._class_mapping = dict()
+    self._class_mapping = {}
 
   def AddMethodMapping(self, from_method, to_method):
     self._method_mapping[from_method].add(to_method)
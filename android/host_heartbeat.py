@@ -23,9 +23,8 @@ def main():
   while True:
     try:
       devices = device_utils.DeviceUtils.HealthyDevices(blacklist=None)
-      for d in devices:
-        d.RunShellCommand(['touch', '/sdcard/host_heartbeat'],
-                          check_return=True)
+      device_utils.DeviceUtils.parallel(devices).RunShellCommand(
+          ['touch', '/sdcard/host_heartbeat'], check_return=True).pGet(None)
     except:
       # Keep the heatbeat running bypassing all errors.
       pass
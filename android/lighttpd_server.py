@@ -17,7 +17,9 @@ import contextlib
 import httplib
 import os
 import random
+import select
 import shutil
+import signal
 import socket
 import subprocess
 import sys
@@ -25,7 +27,6 @@ import tempfile
 import time
 
 from pylib import constants
-from pylib import pexpect
 
 class LighttpdServer(object):
   """Wraps lighttpd server, providing robust startup.
@@ -95,16 +96,20 @@ class LighttpdServer(object):
             'Could not find lighttpd at %s.\n'
             'It may need to be installed (e.g. sudo apt-get install lighttpd)'
             % self.lighttpd_path)
-      # pylint: disable=no-member
-      self.process = pexpect.spawn(self.lighttpd_path,
-                                   ['-D', '-f', self.config_path,
-                                    '-m', self.lighttpd_module_path],
-                                   cwd=self.temp_dir)
+      # Only line-oriented output is needed from the server, so a plain pipe
+      # is enough; there is no need for a pty.
+      self.process = subprocess.Popen([self.lighttpd_path,
+                                       '-D', '-f', self.config_path,
+                                       '-m', self.lighttpd_module_path],
+                                      cwd=self.temp_dir,
+                                      stdout=subprocess.PIPE,
+                                      stderr=subprocess.STDOUT,
+                                      close_fds=True)
       client_error, server_error = self._TestServerConnection()
       if not client_error:
         assert int(open(self.pid_file, 'r').read()) == self.process.pid
         break
-      self.process.close()
+      self._CloseProcess()
 
       if self.fixed_port or 'in use' not in server_error:
         print('Client error:', client_error)
@@ -116,9 +121,22 @@ class LighttpdServer(object):
   def ShutdownHttpServer(self):
     """Shuts down our lighttpd processes."""
     if self.process:
-      self.process.terminate()
+      self._CloseProcess()
     shutil.rmtree(self.temp_dir, ignore_errors=True)
 
+  def _CloseProcess(self):
+    if self.process.poll() is None:
+      self.process.terminate()
+      # Give the server a moment to exit cleanly, then force-kill it so that a
+      # server ignoring SIGTERM cannot hang startup retries or shutdown.
+      deadline = time.time() + 2
+      while self.process.poll() is None and time.time() < deadline:
+        time.sleep(0.1)
+      if self.process.poll() is None:
+        self.process.kill()
+        self.process.wait()
+    self.process.stdout.close()
+
   def _TestServerConnection(self):
     # Wait for server to start
     server_msg = ''
@@ -140,14 +158,13 @@ class LighttpdServer(object):
       except (httplib.HTTPException, socket.error) as client_error:
         pass  # Probably too quick connecting: try again
       # Check for server startup error messages
-      # pylint: disable=no-member
-      ix = self.process.expect([pexpect.TIMEOUT, pexpect.EOF, '.+'],
-                               timeout=timeout)
-      if ix == 2:  # stdout spew from the server
-        server_msg += self.process.match.group(0) # pylint: disable=no-member
-      elif ix == 1:  # EOF -- server has quit so giveup.
-        client_error = client_error or 'Server exited'
-        break
+      readable, _, _ = select.select([self.process.stdout], [], [], timeout)
+      if readable:
+        output = os.read(self.process.stdout.fileno(), 4096)
+        if not output:  # EOF -- server has quit so giveup.
+          client_error = client_error or 'Server exited'
+          break
+        server_msg += output  # stdout spew from the server
     return (client_error or 'Timeout', server_msg)
 
   @staticmethod
@@ -158,11 +175,35 @@ class LighttpdServer(object):
     Args:
       port: Port number to check.
     """
-    if subprocess.call(['fuser', '-kv', '%d/tcp' % port]) == 0:
-      # Give the process some time to terminate and check that it is gone.
-      time.sleep(2)
-      assert subprocess.call(['fuser', '-v', '%d/tcp' % port]) != 0, \
-          'Unable to kill process listening on port %d.' % port
+    # Ask politely first so the port holder can shut down cleanly, and only
+    # SIGKILL (what "fuser -k" sends) whatever survives the grace period.
+    for sig, action in ((signal.SIGTERM, 'Terminating'),
+                        (signal.SIGKILL, 'Killing')):
+      pids = LighttpdServer._GetPidsListeningOnPort(port)
+      if not pids:
+        return
+      for pid in pids:
+        print('%s process %d listening on port %d' % (action, pid, port))
+        try:
+          os.kill(pid, sig)
+        except OSError:
+          pass  # Already gone.
+      # Poll instead of sleeping for the whole grace period, since the port
+      # is usually released almost immediately.
+      deadline = time.time() + 2
+      while time.time() < deadline:
+        if subprocess.call(['fuser', '-s', '%d/tcp' % port]) != 0:
+          return
+        time.sleep(0.1)
+    assert not LighttpdServer._GetPidsListeningOnPort(port), \
+        'Unable to kill process listening on port %d.' % port
+
+  @staticmethod
+  def _GetPidsListeningOnPort(port):
+    with open(os.devnull, 'w') as devnull:
+      fuser = subprocess.Popen(['fuser', '%d/tcp' % port],
+                               stdout=subprocess.PIPE, stderr=devnull)
+      return [int(pid) for pid in fuser.communicate()[0].split()]
 
   @staticmethod
   def _GetDefaultBaseConfig():
@@ -251,7 +292,7 @@ def main(argv):
       raw_input('Server running at http://127.0.0.1:%s -'
                 ' press Enter to exit it.' % server.port)
     else:
-      print('Server exit code:', server.process.exitstatus)
+      print('Server exit code:', server.process.returncode)
   finally:
     server.ShutdownHttpServer()
 
@@ -251,22 +251,30 @@ class LocalDeviceEnvironment(environment.Environment):
 
     self.parallel_devices.pMap(tear_down_device)
 
-    for m in self._logcat_monitors:
+    def stop_logcat_monitor(m):
+      device_serial = m.adb.GetDeviceSerial()
       try:
         m.Stop()
         m.Close()
         _, temp_path = tempfile.mkstemp()
+        line_prefix = 'Device(%s) ' % device_serial
         with open(m.output_file, 'r') as infile:
           with open(temp_path, 'w') as outfile:
             for line in infile:
-              outfile.write('Device(%s) %s' % (m.adb.GetDeviceSerial(), line))
+              outfile.write(line_prefix + line)
         shutil.move(temp_path, m.output_file)
       except base_error.BaseError:
         logging.exception('Failed to stop logcat monitor for %s',
-                          m.adb.GetDeviceSerial())
+                          device_serial)
       except IOError:
         logging.exception('Failed to locate logcat for device %s',
-                          m.adb.GetDeviceSerial())
+                          device_serial)
+
+    # Each monitor waits on its own adb logcat process, so stop them all at
+    # once rather than paying for every device in turn.
+    if self._logcat_monitors:
+      parallelizer.SyncParallelizer(self._logcat_monitors).pMap(
+          stop_logcat_monitor)
 
     if self._logcat_output_file:
       file_utils.MergeFiles(
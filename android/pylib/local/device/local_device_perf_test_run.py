@@ -396,7 +396,10 @@ class LocalDevicePerfTestRun(local_device_test_run.LocalDeviceTestRun):
   def _GetAllDevices(active_devices, devices_path):
     try:
       if devices_path:
-        devices = [device_utils.DeviceUtils(s)
+        # Reuse the environment's instances where possible so that their
+        # cached device state and settings carry over.
+        active_by_serial = {str(d): d for d in active_devices}
+        devices = [active_by_serial.get(s) or device_utils.DeviceUtils(s)
                    for s in device_list.GetPersistentDeviceList(devices_path)]
         if not devices and active_devices:
           logging.warning('%s is empty. Falling back to active devices.',
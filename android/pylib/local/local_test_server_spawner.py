@@ -7,6 +7,7 @@ import time
 
 from devil.android import forwarder
 from devil.android import ports
+from devil.utils import reraiser_thread
 from pylib.base import test_server
 from pylib.constants import host_paths
 
@@ -82,11 +83,19 @@ class LocalTestServerSpawner(test_server.TestServer):
       'address': '127.0.0.1',
       'spawner_url_base': 'http://localhost:%d' % self.port
     })
-    self._device.WriteFile(
-        '%s/net-test-server-config' % self._device.GetExternalStoragePath(),
-        test_server_config)
-    forwarder.Forwarder.Map(
-        [(self.port, self.port)], self._device, self._tool)
+
+    def write_config():
+      self._device.WriteFile(
+          '%s/net-test-server-config' % self._device.GetExternalStoragePath(),
+          test_server_config)
+
+    def map_port():
+      forwarder.Forwarder.Map(
+          [(self.port, self.port)], self._device, self._tool)
+
+    # The config file and the port forwarding are independent of each other,
+    # so run both device round-trips at the same time.
+    reraiser_thread.RunAsync([write_config, map_port])
     self._spawning_server.Start()
 
   #override
@@ -11,10 +11,14 @@ def Memoize(f):
   memoize_dict = {}
   @functools.wraps(f)
   def wrapper(*args, **kwargs):
-    key = repr((args, kwargs))
-    if key not in memoize_dict:
+    # Building the repr() key dominates the cost of a cache hit, so calls
+    # without arguments (the usual case for memoized getters) skip it.
+    key = repr((args, kwargs)) if args or kwargs else ()
+    try:
+      return memoize_dict[key]
+    except KeyError:
       memoize_dict[key] = f(*args, **kwargs)
-    return memoize_dict[key]
+      return memoize_dict[key]
   return wrapper
 
 
@@ -99,6 +99,18 @@ class MemoizeDecoratorTest(unittest.TestCase):
     self.assertEquals(returnValueBasedOnArgsKwargs(2, 1), 3)
     self.assertEquals(returnValueBasedOnArgsKwargs(3, 3), 6)
 
+  def testFunctionMemoizedSeparatelyWithAndWithoutArgs(self):
+    """Tests that |Memoize| keeps no-arg calls apart from calls with args."""
+
+    @decorators.Memoize
+    def returnArgs(*args, **kwargs):
+      return (args, kwargs)
+
+    self.assertEquals(returnArgs(), ((), {}))
+    self.assertEquals(returnArgs(()), (((),), {}))
+    self.assertEquals(returnArgs(k=1), ((), {'k': 1}))
+    self.assertEquals(returnArgs(), ((), {}))
+
 
 if __name__ == '__main__':
   unittest.main(verbosity=2)
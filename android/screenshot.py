@@ -3,11 +3,155 @@
 # Use of this source code is governed by a BSD-style license that can be
 # found in the LICENSE file.
 
+"""Takes a screenshot from an Android device and saves it as a PNG."""
+
+from __future__ import print_function
+
+import argparse
+import logging
+import os
 import sys
+import tempfile
+import time
 
-import devil_chromium
-from devil.android.tools import screenshot
+# devil is imported lazily so that --help and argument errors do not pay for
+# initializing it.
+# pylint: disable=import-error
 
-if __name__ == '__main__':
+_EXEC_OUT_TIMEOUT_SECS = 30
+_PNG_SIGNATURE = '\x89PNG\r\n\x1a\n'
+
+
+def _ExecOutScreencap(device):
+  """Returns the PNG from "adb exec-out screencap -p" on |device|, or None.
+
+  stdout and stderr go to separate files so that nothing adb prints, such as
+  its daemon startup notice, can end up mixed into the image data.
+  """
+  from devil.android.sdk import adb_wrapper
+  from devil.utils import cmd_helper
+
+  with tempfile.TemporaryFile() as png_file, \
+       tempfile.TemporaryFile() as stderr_file:
+    process = cmd_helper.Popen(
+        [adb_wrapper.AdbWrapper.GetAdbPath(), '-s', str(device),
+         'exec-out', 'screencap', '-p'],
+        stdout=png_file, stderr=stderr_file)
+    deadline = time.time() + _EXEC_OUT_TIMEOUT_SECS
+    while process.poll() is None and time.time() < deadline:
+      time.sleep(0.1)
+    if process.poll() is None:
+      process.kill()
+      process.wait()
+      logging.warning('exec-out screencap timed out on %s.', str(device))
+      return None
+    png_file.seek(0)
+    png = png_file.read()
+    stderr_file.seek(0)
+    stderr = stderr_file.read().strip()
+
+  # Older adb clients do not pass screencap's exit status back through
+  # exec-out, so check the data itself before using it.
+  if process.returncode == 0 and png.startswith(_PNG_SIGNATURE):
+    return png
+  logging.warning('exec-out screencap failed on %s (exit code %d): %s',
+                  str(device), process.returncode, stderr)
+  return None
+
+
+def _TakeScreenshot(device, host_file):
+  """Saves a PNG screenshot of |device| to |host_file|.
+
+  On L+ the image is streamed straight to the host with "adb exec-out", which
+  avoids writing it to device storage and pulling it back. Older devices have
+  no binary-safe exec-out, so they use DeviceUtils.TakeScreenshot instead, as
+  does any exec-out capture that times out or does not produce a PNG.
+  """
+  from devil.android.sdk import version_codes
+
+  if device.build_version_sdk >= version_codes.LOLLIPOP:
+    png = _ExecOutScreencap(device)
+    if png is not None:
+      with open(host_file, 'wb') as f:
+        f.write(png)
+      return host_file
+    logging.warning('Falling back to screencap and pull on %s.', str(device))
+  return device.TakeScreenshot(host_file)
+
+
+def main(argv):
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument(
+      '-v', '--verbose',
+      dest='verbose_count',
+      default=0,
+      action='count',
+      help='Verbose level (multiple times for more)')
+  device_group = parser.add_mutually_exclusive_group()
+  device_group.add_argument(
+      '-d', '--device',
+      dest='devices',
+      action='append',
+      help='Serial number of device we should use. May be repeated.')
+  device_group.add_argument(
+      '-a', '--all',
+      action='store_true',
+      help='Take a screenshot on every attached device in parallel, or only '
+           'on $ANDROID_SERIAL if it is set. With more than one device, the '
+           'serial is added to each file name.')
+  parser.add_argument(
+      '--blacklist-file',
+      help='Device blacklist JSON file.')
+  parser.add_argument(
+      '-f', '--file',
+      metavar='FILE',
+      help='Save result to file instead of generating a timestamped file '
+           'name.')
+  parser.add_argument(
+      'host_file',
+      nargs='?',
+      help='File to which the screenshot will be saved. Defaults to a '
+           'timestamped file in the current directory.')
+
+  args = parser.parse_args(argv)
+
+  import devil_chromium
+  from devil.android import device_blacklist
+  from devil.android import device_utils
+  from devil.utils import run_tests_helper
+
+  run_tests_helper.SetLogLevel(args.verbose_count)
   devil_chromium.Initialize()
-  sys.exit(screenshot.main())
+
+  blacklist = (device_blacklist.Blacklist(args.blacklist_file)
+               if args.blacklist_file
+               else None)
+  host_file = args.host_file or args.file or 'screenshot-%s.png' % (
+      time.strftime('%Y%m%dT%H%M%S', time.localtime()))
+
+  if args.all:
+    # An empty device_arg selects all healthy devices, unless $ANDROID_SERIAL
+    # is set, in which case HealthyDevices returns only that device.
+    devices = device_utils.DeviceUtils.HealthyDevices(
+        blacklist=blacklist, device_arg=[])
+  else:
+    devices = device_utils.DeviceUtils.HealthyDevices(
+        blacklist=blacklist, device_arg=args.devices)
+
+  if len(devices) == 1:
+    print('Screenshot saved to %s' % _TakeScreenshot(devices[0], host_file))
+    return 0
+
+  root, ext = os.path.splitext(host_file)
+
+  def take_screenshot(device):
+    return _TakeScreenshot(device, '%s_%s%s' % (root, str(device), ext))
+
+  for path in device_utils.DeviceUtils.parallel(devices).pMap(
+      take_screenshot).pGet(None):
+    print('Screenshot saved to %s' % path)
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main(sys.argv[1:]))